@@ -25,8 +25,7 @@ class MixedStrategy(GenericActiveLearningStrategy):
         self.model.train(self.l_loader, self.valid_loader)
         output = self.model(self.u_loader)
         scores = regression_least_confidence(x=output)
-        ixs = torch.argsort(scores, descending=True).tolist()
-        ixs = [self.u_indices[i] for i in ixs[: 10 * num_annotate]]
+        ixs = self.select_top_unlabelled(scores, 10 * num_annotate)
         subquery = torch.stack(self.data_manager.get_sample_feature_vectors(ixs))
         new_ixs = representative_sampling(subquery)
         return [ixs[i] for i in new_ixs]
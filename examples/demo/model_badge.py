@@ -5,9 +5,11 @@ About BADGE algorithm: https://arxiv.org/abs/1906.03671
 """
 
 import logging
-from typing import List
+from collections import namedtuple
+from typing import List, Optional
 
 import torch
+from torch.utils.data import Subset
 
 # Dataset and machine learning model
 from examples.utils.datasets import BreastCancerDataset  # noqa: E402
@@ -17,6 +19,7 @@ from examples.utils.ml_models import BreastCancerClassification  # noqa: E402
 from pyrelational.data import GenericDataManager
 from pyrelational.informativeness import relative_distance
 from pyrelational.models import LightningModel
+from pyrelational.models.model_utils import maybe_prefetch
 from pyrelational.strategies.generic_al_strategy import GenericActiveLearningStrategy
 
 # dataset
@@ -26,6 +29,10 @@ train_indices = train_ds.indices
 val_indices = val_ds.indices
 test_indices = test_ds.indices
 
+# Per-sample gradients of the last layer kept as separate contiguous blocks:
+# weights of shape (N, E, C) and biases of shape (N, C)
+GradientBundle = namedtuple("GradientBundle", ["weights", "bias"])
+
 
 # model
 
@@ -35,14 +42,48 @@ class BadgeLightningModel(LightningModel):
 
     def __init__(self, model_class, model_config, trainer_config):
         super(BadgeLightningModel, self).__init__(model_class, model_config, trainer_config)
+        if hasattr(torch, "compile"):
+            # on torch >= 2.0 compile the per-batch gradient step once so its
+            # kernels fuse and the python dispatch overhead is amortised
+            # across iterations; older versions keep the eager path
+            self._grad_step = torch.compile(self._grad_step, dynamic=False)
+
+    def _grad_step(self, model, x):
+        """
+        Per-batch body of get_gradients returning the last layer gradients for each sample.
+
+        :param model: trained model exposing return_penultimate_embed/forward_from_embed/criterion
+        :param x: batch of inputs
+        :return: tuple with the weight and bias gradients of the last layer
+        """
+        # compute the penultimate embedding once and finish the forward
+        # pass from it, instead of running the full forward a second time.
+        # no gradient flows through the embedding, so run it under
+        # inference mode to skip autograd bookkeeping for the trunk
+        with torch.inference_mode():
+            e = model.return_penultimate_embed(x)
+        # clone to exit inference mode so the logits can take part in autograd
+        e = e.clone()
+        logits = model.forward_from_embed(e)
+        # detach before argmax so the predicted labels stay out of the autograd graph
+        class_preds = logits.detach().argmax(dim=1)
+        loss = model.criterion(logits, class_preds)  # assumes criterion is defined in model class
+        # find gradients of bias in last layer
+        bias_grad = torch.autograd.grad(loss, logits)[0]
+        # find gradients of weights in last layer as outer product of
+        # embedding and bias gradient, via a broadcast multiply which
+        # avoids the einsum dispatch overhead
+        weights_grad = e.unsqueeze(2) * bias_grad.unsqueeze(1)
+        return weights_grad, bias_grad
 
     def get_gradients(self, loader):
         """
         Get gradients for each sample in dataloader as outlined in BADGE paper.
 
-        Assumes the last layer is a linear layer and return_penultimate_embed/criterion is defined in the model class
+        Assumes the last layer is a linear layer and return_penultimate_embed/forward_from_embed/criterion
+        are defined in the model class
         :param loader: dataloader
-        :return: tensor of gradients for each sample
+        :return: GradientBundle with the weight and bias gradients for each sample
         """
         if self.current_model is None:
             raise ValueError(
@@ -52,22 +93,35 @@ class BadgeLightningModel(LightningModel):
                 """
             )
 
-        model = self.current_model
+        model = self.current_model.to(self.device)
         model.eval()
-        gradients = []
+        num_samples = len(loader.dataset)
+        weights_grads, bias_grads = None, None
+        offset = 0
+        # on cuda, overlap the host to device copy of the next batch with compute
+        loader = maybe_prefetch(loader, self.device)
         for x, _ in loader:
-            model.zero_grad()
-            logits = model(x)
-            class_preds = torch.argmax(logits, dim=1)
-            loss = model.criterion(logits, class_preds)  # assumes criterion is defined in model class
-            e = model.return_penultimate_embed(x)
-            # find gradients of bias in last layer
-            bias_grad = torch.autograd.grad(loss, logits)[0]
-            # find gradients of weights in last layer
-            weights_grad = torch.einsum("be,bc -> bec", e, bias_grad)
-            gradients.append(torch.cat([weights_grad.detach().cpu(), bias_grad.unsqueeze(1).detach().cpu()], 1))
-
-        return torch.cat(gradients, 0)
+            x = x.to(self.device, non_blocking=True)
+            weights_grad, bias_grad = self._grad_step(model, x)
+            batch_size, embed_dim, num_classes = weights_grad.shape
+            if weights_grads is None:
+                # preallocate the full output once the gradient dimensions are known,
+                # as separate weight and bias blocks so each is written and read
+                # contiguously instead of interleaved along the feature axis.
+                # on gpu store them in half precision: BADGE only needs relative
+                # orderings, so this halves the peak allocation and transfer volume
+                dtype = torch.float16 if self.device.type == "cuda" else torch.float32
+                weights_grads = torch.empty((num_samples, embed_dim, num_classes), device=self.device, dtype=dtype)
+                bias_grads = torch.empty((num_samples, num_classes), device=self.device, dtype=dtype)
+            # write each batch into its slice, keeping everything on device
+            weights_grads[offset : offset + batch_size] = weights_grad.detach()
+            bias_grads[offset : offset + batch_size] = bias_grad.detach()
+            offset += batch_size
+
+        # a custom sampler or drop_last can make the loader yield fewer samples
+        # than len(loader.dataset), so trim to the rows actually written.
+        # upcast on the host so the distance computation accumulates in fp32
+        return GradientBundle(weights_grads[:offset].cpu().float(), bias_grads[:offset].cpu().float())
 
 
 model = BadgeLightningModel(model_class=BreastCancerClassification, model_config={}, trainer_config={"epochs": 5})
@@ -83,10 +137,24 @@ data_manager = GenericDataManager(
 
 
 class BadgeStrategy(GenericActiveLearningStrategy):
-    """Implementation of BADGE strategy."""
-
-    def __init__(self, data_manager: GenericDataManager, model: BadgeLightningModel):
+    """Implementation of BADGE strategy.
+
+    :param cache_labelled_gradients: when True, reuse the labelled-set gradients from
+        the previous iteration and only compute gradients for the newly labelled
+        samples. Only sound when the model is fine-tuned between iterations rather
+        than retrained from scratch, hence off by default.
+    """
+
+    def __init__(
+        self,
+        data_manager: GenericDataManager,
+        model: BadgeLightningModel,
+        cache_labelled_gradients: bool = False,
+    ):
         super(BadgeStrategy, self).__init__(data_manager, model)
+        self.cache_labelled_gradients = cache_labelled_gradients
+        self._l_grads_cache: Optional[torch.Tensor] = None
+        self._last_added: List[int] = []
 
     def active_learning_step(self, num_annotate: int) -> List[int]:
         """
@@ -94,11 +162,48 @@ class BadgeStrategy(GenericActiveLearningStrategy):
         :return: indices of samples to label
         """
         self.model.train(self.l_loader, self.valid_loader)
-        u_grads = self.model.get_gradients(self.u_loader)
-        l_grads = self.model.get_gradients(self.l_loader)
+        u_grads = self.flatten_gradients(self.model.get_gradients(self.u_loader))
+        l_grads = self.labelled_gradients()
         scores = relative_distance(u_grads, l_grads)
-        ixs = torch.argsort(scores, descending=True).tolist()
-        return [self.u_indices[i] for i in ixs[:num_annotate]]
+        return self.select_top_unlabelled(scores, num_annotate)
+
+    @staticmethod
+    def flatten_gradients(bundle: GradientBundle) -> torch.Tensor:
+        """
+        Concatenate the weight and bias gradient blocks into one 2D feature matrix
+        for the distance computation, walking each contiguous block exactly once
+
+        :param bundle: gradient bundle returned by get_gradients
+        :return: tensor of shape (N, E * C + C)
+        """
+        return torch.cat([bundle.weights.flatten(1), bundle.bias], 1)
+
+    def labelled_gradients(self) -> torch.Tensor:
+        """
+        Gradients for the labelled set, incrementally updated when caching is enabled
+
+        :return: flattened gradients for each sample in the labelled set
+        """
+        if not self.cache_labelled_gradients:
+            return self.flatten_gradients(self.model.get_gradients(self.l_loader))
+        if self._l_grads_cache is None:
+            self._l_grads_cache = self.flatten_gradients(self.model.get_gradients(self.l_loader))
+            # the full labelled set already covers any pending additions
+            self._last_added = []
+        elif self._last_added:
+            # only compute gradients for the newly labelled samples and
+            # append them to the cached block
+            new_loader = self.data_manager.create_loader(Subset(self.data_manager.dataset, self._last_added))
+            new_grads = self.flatten_gradients(self.model.get_gradients(new_loader))
+            self._l_grads_cache = torch.cat([self._l_grads_cache, new_grads], 0)
+            self._last_added = []
+        return self._l_grads_cache
+
+    def active_learning_update(self, indices: List[int], oracle_interface: object = None, update_tag: str = "") -> None:
+        # extend rather than overwrite so consecutive updates without an
+        # intervening step all reach the gradient cache
+        self._last_added.extend(indices)
+        super(BadgeStrategy, self).active_learning_update(indices, oracle_interface, update_tag)
 
 
 strategy = BadgeStrategy(data_manager=data_manager, model=model)
@@ -81,6 +81,15 @@ class BreastCancerClassification(LightningModule):
         x = self.dropout(self.elu(self.layer_2(x)))
         return x
 
+    def forward_from_embed(self, e: torch.Tensor):
+        """
+        Complete the forward pass from the penultimate embedding.
+
+        :param e: embedding as returned by return_penultimate_embed
+        """
+        e = self.dropout(self.layer_3(e))
+        return self.softmax(e)
+
     def training_step(self, batch, batch_idx):
         x, y = batch
         logits = self(x)
@@ -28,7 +28,7 @@ class GenericDataManager(object):
         loader_batch_sampler: Optional[Sampler[Sequence[int]]] = None,
         loader_num_workers: int = 0,
         loader_collate_fn: Optional[Callable[[List[T]], Any]] = None,
-        loader_pin_memory: bool = False,
+        loader_pin_memory: Optional[bool] = None,
         loader_drop_last: bool = False,
         loader_timeout: float = 0,
     ):
@@ -52,7 +52,8 @@ class GenericDataManager(object):
         :param loader_batch_sampler: a batch sampler for the dataloaders
         :param loader_num_workers: number of cpu workers for dataloaders
         :param loader_collate_fn: collate fn for dataloaders
-        :param loader_pin_memory: pin memory flag for dataloaders
+        :param loader_pin_memory: pin memory flag for dataloaders, defaults to True when cuda is available
+        so host to device copies can be asynchronous
         :param loader_drop_last: drop last flag for dataloaders
         :param loader_timeout: timeout value for dataloaders
         """
@@ -71,10 +72,16 @@ class GenericDataManager(object):
         self.loader_batch_sampler = loader_batch_sampler
         self.loader_num_workers = loader_num_workers
         self.loader_collate_fn = loader_collate_fn
+        if loader_pin_memory is None:
+            loader_pin_memory = torch.cuda.is_available()
         self.loader_pin_memory = loader_pin_memory
         self.loader_drop_last = loader_drop_last
         self.loader_timeout = loader_timeout
 
+        # Incremented every time the labelled/unlabelled split changes so
+        # consumers can detect stale derived state (e.g. cached dataloaders)
+        self.labels_version = 0
+
         # Resolve masks and the values they should take given inputs
         self._resolve_dataset_split_indices()
 
@@ -296,7 +303,7 @@ class GenericDataManager(object):
         else:
             num_labelled = self.random_label_size
 
-        logger.info("## Randomly generating labelled subset with {} samples from the train data".format(num_labelled))
+        logger.info("## Randomly generating labelled subset with %s samples from the train data", num_labelled)
         random.seed(seed)
         l_indices = set(random.sample(self.train_indices, num_labelled))
         u_indices = set(self.train_indices) - set(l_indices)
@@ -314,6 +321,7 @@ class GenericDataManager(object):
         """
         self.l_indices = list(set(self.l_indices + indices))
         self.u_indices = list(set(self.u_indices) - set(indices))
+        self.labels_version += 1
 
     def percentage_labelled(self) -> float:
         """Percentage of total available dataset labelled."""
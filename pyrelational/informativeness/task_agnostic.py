@@ -43,11 +43,12 @@ def relative_distance(
         sample to the reference set
     """
     if isinstance(query_set, get_args(Array)):
-        query_set = np.array(query_set)
+        # asarray shares memory with cpu tensors/arrays instead of copying
+        query_set = np.asarray(query_set)
         query_set = query_set.reshape((query_set.shape[0], -1))
 
     if isinstance(reference_set, get_args(Array)):
-        reference_set = np.array(reference_set)
+        reference_set = np.asarray(reference_set)
         reference_set = reference_set.reshape((reference_set.shape[0], -1))
 
     if isinstance(reference_set, np.ndarray) and isinstance(query_set, np.ndarray):
@@ -1,7 +1,72 @@
 import warnings
-from typing import List, Union
+from typing import Any, List, Union
 
 import torch
+from torch.utils.data import DataLoader
+
+
+class CUDAPrefetcher:
+    """
+    Iterator wrapper around a pytorch dataloader which preloads the next batch
+    onto the GPU on a side CUDA stream while the current batch is being processed,
+    overlapping the host to device copies with compute.
+
+    :param loader: pytorch dataloader whose batches are (tuples of) tensors
+    :param device: cuda device onto which the batches should be loaded
+    """
+
+    def __init__(self, loader: DataLoader, device: Union[str, torch.device] = "cuda"):
+        self.loader = loader
+        self.device = torch.device(device)
+        self.stream = torch.cuda.Stream(self.device)
+
+    def __iter__(self) -> "CUDAPrefetcher":
+        self.iterator = iter(self.loader)
+        self.next_batch = None
+        self._preload()
+        return self
+
+    def _preload(self) -> None:
+        """Fetch the next batch and start copying it to device on the side stream"""
+        try:
+            batch = next(self.iterator)
+        except StopIteration:
+            self.next_batch = None
+            return
+        with torch.cuda.stream(self.stream):
+            self.next_batch = [
+                b.to(self.device, non_blocking=True) if isinstance(b, torch.Tensor) else b for b in batch
+            ]
+
+    def __next__(self) -> List[Any]:
+        if self.next_batch is None:
+            raise StopIteration
+        # make sure the copy of the current batch has finished before using it
+        torch.cuda.current_stream(self.device).wait_stream(self.stream)
+        batch = self.next_batch
+        for b in batch:
+            if isinstance(b, torch.Tensor):
+                b.record_stream(torch.cuda.current_stream(self.device))
+        self._preload()
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.loader)
+
+
+def maybe_prefetch(loader: DataLoader, device: Union[str, torch.device]) -> Union[DataLoader, CUDAPrefetcher]:
+    """
+    Wraps the loader in a CUDAPrefetcher when the device is a cuda device,
+    otherwise returns the loader unchanged
+
+    :param loader: pytorch dataloader to iterate over
+    :param device: device onto which the batches should be loaded
+    :return: prefetching iterator on cuda, the untouched loader otherwise
+    """
+    device = torch.device(device)
+    if device.type == "cuda":
+        return CUDAPrefetcher(loader, device)
+    return loader
 
 
 def _determine_device(gpus: Union[List[int], str, int, None]) -> torch.device:
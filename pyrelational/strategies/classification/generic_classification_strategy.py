@@ -22,5 +22,4 @@ class GenericClassificationStrategy(GenericActiveLearningStrategy, ABC):
         if not torch.allclose(output.sum(1), torch.tensor(1.0)):
             output = softmax(output)
         uncertainty = self.scoring_fn(softmax(output))
-        ixs = torch.argsort(uncertainty, descending=True).tolist()
-        return [self.u_indices[i] for i in ixs[:num_annotate]]
+        return self.select_top_unlabelled(uncertainty, num_annotate)
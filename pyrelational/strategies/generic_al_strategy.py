@@ -5,10 +5,11 @@ functions and general arbiters of the active learning pipeline
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
+import torch
 from tabulate import tabulate
 from torch.utils.data import DataLoader
 
@@ -37,8 +38,18 @@ class GenericActiveLearningStrategy(ABC):
         self.model = model
         self.iteration = 0
 
+        # Cache for the dataloader properties below, tied to the data manager's
+        # labels_version so a stale loader is never served after a split change
+        self._cached_loaders: Dict[str, DataLoader] = {}
+        self._cached_loaders_version = data_manager.labels_version
+
         # Datastructures for logging values of interest
         self.performances = defaultdict(dict)
+        # Columnar mirror of the per-iteration results, one list per metric,
+        # so performance_history can assemble its frame without a nested walk
+        self._performance_iterations: List[int] = []
+        self._performance_columns: Dict[str, List] = defaultdict(list)
+        self._performance_rows: Dict[int, int] = {}
         self.labelled_by = {}
         self.log_labelled_by(data_manager.l_indices, tag="Initialisation")
 
@@ -108,6 +119,19 @@ class GenericActiveLearningStrategy(ABC):
         """
         pass
 
+    def select_top_unlabelled(self, scores: torch.Tensor, num_annotate: int) -> List[int]:
+        """Selects the dataset indices of the top scoring unlabelled observations.
+        Uses a partial top-k selection rather than a full sort of the scores
+
+        :param scores: tensor with one score per sample in the unlabelled set,
+                ordered as self.u_indices
+        :param num_annotate: number of observations from u to suggest for labelling
+        :return: list of dataset indices of the top scoring unlabelled observations
+        """
+        num_annotate = min(num_annotate, len(scores))
+        ixs = torch.topk(scores, num_annotate, largest=True, sorted=False).indices
+        return np.asarray(self.u_indices)[ixs.cpu().numpy()].tolist()
+
     def active_learning_update(self, indices: List[int], oracle_interface: object = None, update_tag: str = "") -> None:
         """
         Updates labels based on indices selected for labelling
@@ -123,11 +147,12 @@ class GenericActiveLearningStrategy(ABC):
             oracle_interface.update_dataset(self.data_manager, indices)
             self.update_annotations(indices)
 
-        # Logging
+        # Logging, snapshot the index lists once rather than per access
         self.iteration += 1
-        logger.info("Length of labelled %s" % (len(self.l_indices)))
-        logger.info("Length of unlabelled %s" % (len(self.u_indices)))
-        logger.info("Percentage labelled %s" % self.percentage_labelled)
+        l_indices, u_indices = self.l_indices, self.u_indices
+        logger.info("Length of labelled %s", len(l_indices))
+        logger.info("Length of unlabelled %s", len(u_indices))
+        logger.info("Percentage labelled %s", self.percentage_labelled)
         self.log_labelled_by(indices, tag=update_tag)
 
     def full_active_learning_run(
@@ -165,9 +190,12 @@ class GenericActiveLearningStrategy(ABC):
                 query_history[iter_count] = observations_for_labelling
 
             # Record the current performance
-            self.performances[self.iteration] = self.current_performance(
-                test_loader=test_loader,
-                query=observations_for_labelling,
+            self.record_performance(
+                self.iteration,
+                self.current_performance(
+                    test_loader=test_loader,
+                    query=observations_for_labelling,
+                ),
             )
 
             self.active_learning_update(
@@ -180,10 +208,32 @@ class GenericActiveLearningStrategy(ABC):
 
         # Final update the model and check final test performance
         self.model.train(self.l_loader, self.valid_loader)
-        self.performances[self.iteration] = self.current_performance(test_loader=test_loader)
+        self.record_performance(self.iteration, self.current_performance(test_loader=test_loader))
         if return_query_history:
             return query_history
 
+    def record_performance(self, iteration: int, result: Dict) -> None:
+        """Records an iteration's metric results in the performances mapping
+        and in the columnar mirror used by performance_history
+
+        :param iteration: iteration at which the results were obtained
+        :param result: dictionary containing metric results on test set
+        """
+        self.performances[iteration] = result
+        if iteration in self._performance_rows:
+            row = self._performance_rows[iteration]
+            for metric, value in result.items():
+                column = self._performance_columns[metric]
+                if len(column) <= row:
+                    # metric not recorded before, pad so all columns stay aligned
+                    column.extend([np.nan] * (len(self._performance_iterations) - len(column)))
+                column[row] = value
+        else:
+            self._performance_rows[iteration] = len(self._performance_iterations)
+            self._performance_iterations.append(iteration)
+            for metric, value in result.items():
+                self._performance_columns[metric].append(value)
+
     def update_annotations(self, indices: List[int]) -> None:
         """
         Update labels in the datamanager train set based on indices selected for labelling
@@ -196,31 +246,32 @@ class GenericActiveLearningStrategy(ABC):
         active learning iterations
         """
         keys = sorted(set(self.performances.keys()) - {"full"})
-        logger.info("KEYS: {}".format(keys))
-        df = []
+        logger.info("KEYS: %s", keys)
+        num_rows = len(self._performance_iterations)
+        if num_rows and num_rows == len(keys) and all(len(c) == num_rows for c in self._performance_columns.values()):
+            # columnar fast path, the frame is assembled without per-cell python work
+            columns = {c: self._performance_columns[c] for c in sorted(self._performance_columns)}
+            return pd.DataFrame({"Iteration": self._performance_iterations, **columns})
+
+        # fall back to walking the performances mapping, which covers results
+        # assigned directly to it rather than through record_performance
         if "full" in self.performances:
             columns = ["Iteration"] + sorted(list(self.performances["full"].keys()))
-            logger.info("COLUMNS: {}".format(columns))
-            logger.info("Full inside")
+        elif self.iteration in self.performances:
+            columns = ["Iteration"] + sorted(list(self.performances[self.iteration].keys()))
         else:
-            if self.iteration in self.performances:
-                columns = ["Iteration"] + sorted(list(self.performances[self.iteration].keys()))
-            else:
-                columns = ["Iteration"]
-            logger.info("COLUMNS: {}".format(columns))
-            logger.info("Full Missing")
+            columns = ["Iteration"]
+        logger.info("COLUMNS: %s", columns)
+
+        records = []
         for k in keys:
-            row = [k]
-            logger.info(self.performances[k])
-            for c in columns[1:]:
-                if isinstance(self.performances[k], list):
-                    row.append(self.performances[k][0][c])
-                else:
-                    row.append(self.performances[k][c])
-            df.append(row)
-
-        pd_df = pd.DataFrame(df, columns=columns)
-        return pd_df
+            result = self.performances[k]
+            if isinstance(result, list):
+                result = result[0]
+            records.append({"Iteration": k, **result})
+
+        # pandas selects the requested columns and fills missing metrics with NaN
+        return pd.DataFrame.from_records(records, columns=columns)
 
     def log_labelled_by(self, indices: List[int], tag: str = ""):
         """
@@ -231,8 +282,24 @@ class GenericActiveLearningStrategy(ABC):
         :param indices: list of indices selected for labelling
         :param tag: string which indicates what the observations where labelled by
         """
-        for indx in indices:
-            self.labelled_by[indx] = tag
+        self.labelled_by.update(dict.fromkeys(indices, tag))
+
+    def _get_cached_loader(self, name: str, factory: Callable[[], DataLoader]) -> DataLoader:
+        """Memoises DataLoader construction so repeated property accesses within
+        an iteration do not rebuild loaders (and respawn their workers). The cache
+        follows the data manager's labels_version, so any change to the
+        labelled/unlabelled split invalidates it even when update_train_labels
+        is called on the data manager directly
+
+        :param name: key under which the loader is cached
+        :param factory: zero-argument callable building the loader on a cache miss
+        """
+        if self._cached_loaders_version != self.data_manager.labels_version:
+            self._cached_loaders.clear()
+            self._cached_loaders_version = self.data_manager.labels_version
+        if name not in self._cached_loaders:
+            self._cached_loaders[name] = factory()
+        return self._cached_loaders[name]
 
     @property
     def u_indices(self) -> List[int]:
@@ -240,7 +307,7 @@ class GenericActiveLearningStrategy(ABC):
 
     @property
     def u_loader(self) -> DataLoader:
-        return self.data_manager.get_unlabelled_loader()
+        return self._get_cached_loader("unlabelled", self.data_manager.get_unlabelled_loader)
 
     @property
     def l_indices(self) -> List[int]:
@@ -248,19 +315,19 @@ class GenericActiveLearningStrategy(ABC):
 
     @property
     def l_loader(self) -> DataLoader:
-        return self.data_manager.get_labelled_loader()
+        return self._get_cached_loader("labelled", self.data_manager.get_labelled_loader)
 
     @property
     def train_loader(self) -> DataLoader:
-        return self.data_manager.get_train_loader(full=True)
+        return self._get_cached_loader("train", lambda: self.data_manager.get_train_loader(full=True))
 
     @property
     def valid_loader(self) -> DataLoader:
-        return self.data_manager.get_validation_loader()
+        return self._get_cached_loader("validation", self.data_manager.get_validation_loader)
 
     @property
     def test_loader(self) -> DataLoader:
-        return self.data_manager.get_test_loader()
+        return self._get_cached_loader("test", self.data_manager.get_test_loader)
 
     @property
     def percentage_labelled(self) -> float:
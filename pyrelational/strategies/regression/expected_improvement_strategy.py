@@ -1,7 +1,5 @@
 from typing import List
 
-import torch
-
 from pyrelational.data import GenericDataManager
 from pyrelational.informativeness import regression_expected_improvement
 from pyrelational.models import GenericModel
@@ -20,5 +18,4 @@ class ExpectedImprovementStrategy(GenericActiveLearningStrategy):
         output = self.model(self.u_loader)
         max_label = max(self.data_manager.get_sample_labels(self.l_indices))
         uncertainty = regression_expected_improvement(x=output, max_label=max_label)
-        ixs = torch.argsort(uncertainty, descending=True).tolist()
-        return [self.u_indices[i] for i in ixs[:num_annotate]]
+        return self.select_top_unlabelled(uncertainty, num_annotate)
@@ -1,7 +1,5 @@
 from abc import ABC
 
-import torch
-
 from pyrelational.data import GenericDataManager
 from pyrelational.models import GenericModel
 from pyrelational.strategies.generic_al_strategy import GenericActiveLearningStrategy
@@ -19,5 +17,4 @@ class GenericRegressionStrategy(GenericActiveLearningStrategy, ABC):
         self.model.train(self.l_loader, self.valid_loader)
         output = self.model(self.u_loader)
         scores = self.scoring_fn(x=output)
-        ixs = torch.argsort(scores, descending=True).tolist()
-        return [self.u_indices[i] for i in ixs[:num_annotate]]
+        return self.select_top_unlabelled(scores, num_annotate)
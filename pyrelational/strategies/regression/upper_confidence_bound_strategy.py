@@ -1,7 +1,5 @@
 from typing import List
 
-import torch
-
 from pyrelational.data import GenericDataManager
 from pyrelational.informativeness import regression_upper_confidence_bound
 from pyrelational.models import GenericModel
@@ -20,5 +18,4 @@ class UpperConfidenceBoundStrategy(GenericActiveLearningStrategy):
         self.model.train(self.l_loader, self.valid_loader)
         output = self.model(self.u_loader)
         uncertainty = regression_upper_confidence_bound(x=output, kappa=self.kappa)
-        ixs = torch.argsort(uncertainty, descending=True).tolist()
-        return [self.u_indices[i] for i in ixs[:num_annotate]]
+        return self.select_top_unlabelled(uncertainty, num_annotate)
@@ -1,7 +1,5 @@
 from typing import List
 
-import torch
-
 from pyrelational.data import GenericDataManager
 from pyrelational.informativeness import relative_distance
 from pyrelational.models import GenericModel
@@ -20,5 +18,4 @@ class RelativeDistanceStrategy(GenericActiveLearningStrategy):
 
     def active_learning_step(self, num_annotate: int, metric: str = "euclidean") -> List[int]:
         scores = relative_distance(self.u_loader, self.l_loader, metric=metric)
-        ixs = torch.argsort(scores, descending=True).tolist()
-        return [self.u_indices[i] for i in ixs[:num_annotate]]
+        return self.select_top_unlabelled(scores, num_annotate)
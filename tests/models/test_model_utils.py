@@ -0,0 +1,75 @@
+"""Unit tests for model utilities
+"""
+import contextlib
+
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from pyrelational.models.model_utils import CUDAPrefetcher, maybe_prefetch
+
+
+class DummyStream:
+    """Stands in for torch.cuda.Stream so the prefetcher can run on cpu-only CI"""
+
+    def __init__(self, device=None):
+        self.device = device
+
+    def wait_stream(self, stream):
+        pass
+
+
+@pytest.fixture
+def stub_cuda_streams(monkeypatch):
+    """Stub the cuda stream machinery so the iterator contract is testable on cpu"""
+    monkeypatch.setattr(torch.cuda, "Stream", DummyStream)
+    monkeypatch.setattr(torch.cuda, "stream", lambda stream: contextlib.nullcontext())
+    monkeypatch.setattr(torch.cuda, "current_stream", lambda device=None: DummyStream(device))
+    monkeypatch.setattr(torch.Tensor, "record_stream", lambda self, stream: None)
+
+
+def get_loader(batch_size=4):
+    x = torch.arange(10, dtype=torch.float32).unsqueeze(1)
+    y = torch.arange(10)
+    return DataLoader(TensorDataset(x, y), batch_size=batch_size)
+
+
+def test_prefetcher_yields_same_batches_as_loader(stub_cuda_streams):
+    loader = get_loader()
+    prefetcher = CUDAPrefetcher(loader, device="cpu")
+    assert len(prefetcher) == len(loader)
+
+    batches = list(prefetcher)
+    reference = list(loader)
+    assert len(batches) == len(reference)
+    for (x, y), (ref_x, ref_y) in zip(batches, reference):
+        assert torch.equal(x, ref_x)
+        assert torch.equal(y, ref_y)
+
+
+def test_prefetcher_exhaustion_and_reset(stub_cuda_streams):
+    loader = get_loader()
+    prefetcher = CUDAPrefetcher(loader, device="cpu")
+
+    iterator = iter(prefetcher)
+    for _ in range(len(loader)):
+        next(iterator)
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+    # __iter__ resets the iterator so the prefetcher can be consumed again
+    assert len(list(prefetcher)) == len(loader)
+
+
+def test_prefetcher_passes_non_tensor_elements_through(stub_cuda_streams):
+    loader = DataLoader(list(range(8)), batch_size=4, collate_fn=lambda batch: [torch.tensor(batch), "tag"])
+    prefetcher = CUDAPrefetcher(loader, device="cpu")
+    for x, tag in prefetcher:
+        assert isinstance(x, torch.Tensor)
+        assert tag == "tag"
+
+
+def test_maybe_prefetch_keeps_plain_loader_on_cpu():
+    loader = get_loader()
+    assert maybe_prefetch(loader, torch.device("cpu")) is loader
+    assert maybe_prefetch(loader, "cpu") is loader
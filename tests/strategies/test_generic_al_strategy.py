@@ -0,0 +1,88 @@
+"""Unit tests for the generic active learning strategy utilities
+"""
+import numpy as np
+import pandas as pd
+import torch
+
+from pyrelational.models.mcdropout_model import LightningMCDropoutModel
+from pyrelational.strategies.task_agnostic import RandomAcquisitionStrategy
+from tests.test_utils import BreastCancerClassifier, get_classification_dataset
+
+
+def get_strategy():
+    gdm = get_classification_dataset(labelled_size=100)
+    model = LightningMCDropoutModel(BreastCancerClassifier, {"ensemble_size": 3}, {"epochs": 1})
+    return RandomAcquisitionStrategy(data_manager=gdm, model=model)
+
+
+def test_select_top_unlabelled():
+    strategy = get_strategy()
+    scores = torch.randn(len(strategy.u_indices))
+
+    selected = strategy.select_top_unlabelled(scores, 10)
+    assert len(selected) == 10
+    # same selection as the previous full argsort + slice idiom
+    expected = [strategy.u_indices[i] for i in torch.argsort(scores, descending=True).tolist()[:10]]
+    assert set(selected) == set(expected)
+
+
+def test_select_top_unlabelled_clamps_num_annotate():
+    strategy = get_strategy()
+    scores = torch.randn(len(strategy.u_indices))
+
+    # asking for more samples than are left returns the whole unlabelled set
+    selected = strategy.select_top_unlabelled(scores, len(scores) + 100)
+    assert sorted(selected) == sorted(strategy.u_indices)
+
+
+def test_performance_history_fast_path_matches_fallback():
+    strategy = get_strategy()
+    strategy.record_performance(0, {"test_loss": 1.0, "hit_ratio": 0.1})
+    strategy.record_performance(1, {"test_loss": 0.8, "hit_ratio": 0.2})
+    fast = strategy.performance_history()
+
+    # empty the columnar mirror so performance_history walks the performances mapping
+    strategy._performance_iterations = []
+    strategy._performance_columns.clear()
+    strategy._performance_rows = {}
+    fallback = strategy.performance_history()
+
+    pd.testing.assert_frame_equal(fast, fallback)
+
+
+def test_record_performance_overwrite_with_new_metric():
+    strategy = get_strategy()
+    strategy.record_performance(0, {"test_loss": 1.0})
+    strategy.record_performance(1, {"test_loss": 0.8})
+    # re-recording an iteration overwrites its row, and a metric not seen
+    # before is padded with NaN for the other iterations
+    strategy.record_performance(0, {"test_loss": 0.9, "hit_ratio": 0.5})
+
+    df = strategy.performance_history()
+    assert df.shape == (2, 3)
+    assert df["test_loss"].tolist() == [0.9, 0.8]
+    assert df["hit_ratio"][0] == 0.5
+    assert np.isnan(df["hit_ratio"][1])
+
+
+def test_performance_history_fills_missing_metrics_with_nan():
+    strategy = get_strategy()
+    strategy.record_performance(0, {"test_loss": 1.0, "hit_ratio": 0.1})
+    strategy.record_performance(1, {"test_loss": 0.8})
+
+    df = strategy.performance_history()
+    assert np.isnan(df["hit_ratio"][1])
+
+
+def test_cached_loaders_invalidate_when_split_changes():
+    strategy = get_strategy()
+
+    u_loader = strategy.u_loader
+    assert strategy.u_loader is u_loader  # memoised while the split is unchanged
+    strategy.update_annotations([strategy.u_indices[0]])
+    assert strategy.u_loader is not u_loader
+
+    # updating the data manager directly must also invalidate the cache
+    l_loader = strategy.l_loader
+    strategy.data_manager.update_train_labels([strategy.u_indices[0]])
+    assert strategy.l_loader is not l_loader